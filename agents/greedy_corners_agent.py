@@ -5,7 +5,6 @@
 from agents.agent import Agent
 from store import register_agent
 from helpers import get_valid_moves, execute_move
-import copy
 import random
 import numpy as np
 
@@ -42,7 +41,7 @@ class StudentAgent(Agent):
         best_score = float('-inf')
 
         for move in legal_moves:
-            simulated_board = copy.deepcopy(board)
+            simulated_board = board.copy()
             execute_move(simulated_board, move, color)
             # evaluate by piece difference, corner bonus, and opponent mobility
             move_score = self.evaluate_board(simulated_board, color, opponent)
@@ -4,7 +4,6 @@ from store import register_agent
 import sys
 import numpy as np
 import random
-from copy import deepcopy
 import time
 from helpers import random_move, execute_move, check_endgame, get_valid_moves
 from collections import defaultdict
@@ -36,7 +35,7 @@ def evaluate_action(self, board, action, color):
         """
         opponent = PLAYER_SWAP_DICT[color]
         # Execute action
-        next_state = deepcopy(board)
+        next_state = board.copy()
         execute_move(next_state, action, color)
 
         # piece difference
@@ -105,7 +104,7 @@ class MCTSNode:
 
     # Pop the selected action
     action = self._untried_actions.pop(selected_index)
-    next_state = deepcopy(self.state)
+    next_state = self.state.copy()
     execute_move(next_state, action[0], self.current_player)
 
     child_node = MCTSNode(
@@ -130,7 +129,7 @@ class MCTSNode:
   def rollout(self):
     # This function returns the reward as a dictionary which maps from the player number to the reward for that player
 
-    current_rollout_state = deepcopy(self.state)
+    current_rollout_state = self.state.copy()
     current_rollout_player = self.current_player
 
     rollout_depth = 0
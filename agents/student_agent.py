@@ -171,6 +171,9 @@ class StudentAgent(Agent):
     self.max_depth = 4   # max minimax search depth for given iteration of iterative deepening
     self.start_depth = 2  # will become clear at `run_ab_pruning()`
 
+    # Valid moves per (board bytes, player), reused across iterative deepening passes of a turn
+    self.move_cache = {}
+
     # Get profiler report at each of the agent's move.
     self.verbose = 1
 
@@ -182,6 +185,18 @@ class StudentAgent(Agent):
     return np.sum(state.board == state.max_player)  # all, faster still
 
 
+  def get_moves(self, chess_board, player: int) -> list[MoveCoordinates]:
+    """
+    Get valid moves, reusing the ones generated for the same position earlier this turn
+    """
+    key = (chess_board.tobytes(), player)
+    valid_moves = self.move_cache.get(key)
+    if valid_moves is None:
+      valid_moves = super_fast_moves(chess_board, player)
+      self.move_cache[key] = valid_moves
+    return valid_moves
+
+
   def _ab_pruning(self, s: MinimaxNode, alpha: float, beta: float, depth: int) -> float:
     """
     Recursive alpha-beta pruning call
@@ -193,7 +208,7 @@ class StudentAgent(Agent):
       # State (node) is at cutoff.
       return self.utility(s)
 
-    valid_moves = super_fast_moves(s.board, s.player)
+    valid_moves = self.get_moves(s.board, s.player)
 
     if len(valid_moves) == 0:
       # State is at cutoff.
@@ -274,6 +289,7 @@ class StudentAgent(Agent):
     # Some simple code to help you with timing. Consider checking
 
     self.start_time = time.time()
+    self.move_cache.clear()
     
     next_move = self.run_ab_pruning(chess_board, player, opponent)
 
@@ -17,6 +17,7 @@ Functions:
     execute_move            - update the chess_board by simulating a move
     check_endgame           - check for termination, who's won but also helpful to score non-terminated games
     get_valid_moves         - use this to get the children in your tree
+    has_valid_moves         - cheaper than get_valid_moves when you only need to know whether a player can move
     random_move             - basis of the random agent and can be used to simulate play
 
     For all, the chess_board is an np array of integers, size nxn and integer values indicating square occupancies.
@@ -76,6 +77,13 @@ def get_two_tile_directions() -> list[tuple]:
             (-2, -1), (2, -1), (-1, -2), (-1, 2),
             (-2, -2), (-2, 2), (2, -2), (2, 2)] 
 
+# Built once at import time so the per-move checks don't rebuild these lists on every call
+ONE_TILE_DIRECTIONS = tuple(get_directions())
+ALL_MOVE_DIRECTIONS = tuple(get_directions() + get_two_tile_directions())
+ALL_MOVE_DIRECTIONS_SET = frozenset(ALL_MOVE_DIRECTIONS)
+ALL_MOVE_OFFSETS = np.array(ALL_MOVE_DIRECTIONS)
+OPPONENT_MAP = {1: 2, 2: 1} # This lets us quickly access the value corresponding to the opponent on the board based on current player number
+
 
 def check_move_validity(chess_board, move_coords: MoveCoordinates, player: int) -> bool:
     """
@@ -104,12 +112,9 @@ def check_move_validity(chess_board, move_coords: MoveCoordinates, player: int)
         return False 
     
     # Check if distance between discs is in the set of valid directions
-    valid_distances_list = get_directions()
-    valid_distances_list.extend(get_two_tile_directions())
-
     move_dist = (dest_tile[0] - src_tile[0], dest_tile[1] - src_tile[1])
 
-    if not move_dist in valid_distances_list:
+    if not move_dist in ALL_MOVE_DIRECTIONS_SET:
         return False
     
     return True
@@ -124,17 +129,16 @@ def count_disc_count_change(chess_board, move_coords: MoveCoordinates, player: i
         The change in player disc count from this move.
         -1 indicates any form of invalid move.
     """
-    opponent_map = {1: 2, 2: 1} # This lets us quickly access the value corresponding to the opponent on the board based on current player number
-
     r_dest, c_dest = move_coords.get_dest()
 
     if not check_move_validity(chess_board, move_coords, player):
         return -1
     
+    opponent = OPPONENT_MAP[player]
     discs_gained = 0
 
     # Check if move captures any opponent discs in any direction
-    for dir in get_directions():
+    for dir in ONE_TILE_DIRECTIONS:
         adj_tile = (r_dest + dir[0], c_dest + dir[1])
 
         # Check if adjacent tile is on the board
@@ -142,7 +146,7 @@ def count_disc_count_change(chess_board, move_coords: MoveCoordinates, player: i
             continue
 
         # If the tile, is an opponent, count it
-        if chess_board[adj_tile[0], adj_tile[1]] == opponent_map[player]:
+        if chess_board[adj_tile[0], adj_tile[1]] == opponent:
             discs_gained += 1
 
     # If the move is single tile, count an extra disc for "duplication"
@@ -156,18 +160,17 @@ def execute_move(chess_board, move_coords: MoveCoordinates, player: int):
     """
     Play the move specified by altering the chess_board.
     Note that chess_board is a pass-by-reference in/output parameter.
-    Consider copy.deepcopy() of the chess_board if you want to consider numerous possibilities.
+    Consider chess_board.copy() (cheaper than copy.deepcopy() for numpy arrays) if you want to consider numerous possibilities.
     """
-    opponent_map = {1: 2, 2: 1} # This lets us quickly access the value corresponding to the opponent on the board based on current player number
-
     if not check_move_validity(chess_board, move_coords, player): # Throw an exception instead of executing an invalid move. This exception should be handled in the simulator logic
         raise Exception(f"Executing an invalid move! Player {player} is moving from ({move_coords.row_src},{move_coords.col_src}) to ({move_coords.row_dest},{move_coords.col_dest})")
 
+    opponent = OPPONENT_MAP[player]
     r_dest, c_dest = move_coords.get_dest()
     chess_board[r_dest, c_dest] = player
 
     # Flip opponent's discs in all directions where captures occur
-    for direction in get_directions():
+    for direction in ONE_TILE_DIRECTIONS:
         adj_tile = (r_dest + direction[0], c_dest + direction[1])
 
         # Check if tile is on the board
@@ -175,7 +178,7 @@ def execute_move(chess_board, move_coords: MoveCoordinates, player: int):
             continue
 
         # If the tile, is an opponent, flip it
-        if chess_board[adj_tile[0], adj_tile[1]] == opponent_map[player]:
+        if chess_board[adj_tile[0], adj_tile[1]] == opponent:
             chess_board[adj_tile[0], adj_tile[1]] = player
 
     # If the move is two-tiles, empty the source tile
@@ -202,11 +205,14 @@ def check_endgame(chess_board):
 
     is_endgame = False
 
-    if np.sum(chess_board == 0) == 0:
+    # Count empty squares and both players' discs in one pass over the board
+    tile_counts = np.bincount(chess_board.ravel(), minlength=3)
+
+    if tile_counts[0] == 0:
         is_endgame = True  # When there are no spaces left, the game is over, score is current piece count
 
-    p0_score = np.sum(chess_board == 1)
-    p1_score = np.sum(chess_board == 2)
+    p0_score = tile_counts[1]
+    p1_score = tile_counts[2]
 
     # Handle special case where one player is totally eliminated
     if p0_score == 0:
@@ -229,24 +235,47 @@ def get_valid_moves(chess_board,player:int) -> list[MoveCoordinates]:
 
     """
 
+    # Check every (player disc, direction) pair at once: dests has shape (n_discs, 24, 2)
+    sources = np.argwhere(chess_board == player)
+    dests = sources[:, None, :] + ALL_MOVE_OFFSETS[None, :, :]
+
+    # A destination is valid if it is on the board and empty
+    valid = (
+        (dests[..., 0] >= 0) & (dests[..., 0] < chess_board.shape[0])
+        & (dests[..., 1] >= 0) & (dests[..., 1] < chess_board.shape[1])
+    )
+    on_board = dests[valid]
+    valid[valid] = chess_board[on_board[:, 0], on_board[:, 1]] == 0
+
+    # np.nonzero walks the mask in row-major order, so moves are listed source by source
+    # in the same direction order as ALL_MOVE_DIRECTIONS
+    src_idx, dir_idx = np.nonzero(valid)
+    src_list = sources[src_idx].tolist()
+    dest_list = dests[src_idx, dir_idx].tolist()
+
+    return [MoveCoordinates(src=tuple(src), dest=tuple(dest)) for src, dest in zip(src_list, dest_list)]
+
+def has_valid_moves(chess_board, player: int) -> bool:
+    """
+    Check whether the player has at least one valid move.
+    Stops at the first valid move found instead of enumerating them all.
+
+    Returns
+    -------
+    bool
+        Whether any valid move exists.
+    """
+
     board_size = chess_board.shape[0]
-    valid_moves = []
     for r in range(board_size):
         for c in range(board_size):
-            # Check square has a player's disc
             if chess_board[r, c] == player:
-                src = (r,c)
-                # loop over all possible moves
-                candidate_move_list = get_directions()
-                candidate_move_list.extend(get_two_tile_directions())
-
-                for dir in candidate_move_list:
+                for dir in ALL_MOVE_DIRECTIONS:
                     dest_tile = (r + dir[0], c + dir[1])
-                    valid_move = MoveCoordinates(src=(r,c), dest=dest_tile)
-                    if check_move_validity(chess_board, valid_move, player):
-                        valid_moves.append(valid_move)
+                    if check_move_validity(chess_board, MoveCoordinates(src=(r,c), dest=dest_tile), player):
+                        return True
 
-    return valid_moves
+    return False
 
 def random_move(chess_board, player: int) -> MoveCoordinates:
     """
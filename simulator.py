@@ -5,12 +5,30 @@ import logging
 import numpy as np
 import datetime
 import os
+import random
+import csv
+import zlib
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 logging.basicConfig(format="%(levelname)s:%(message)s", level=logging.INFO)
 
 logger = logging.getLogger(__name__)
 
 
+def parse_shard(value):
+    """
+    Parse an "i/N" shard spec into (i, N), with 0 <= i < N.
+    """
+    try:
+        idx, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Shard must look like i/N, got '{value}'")
+    if not 0 <= idx < total:
+        raise argparse.ArgumentTypeError(f"Shard index must be in [0, {total}), got {idx}")
+    return idx, total
+
+
 def get_args():
     parser = argparse.ArgumentParser()
     parser.add_argument("--player_1", type=str, default="random_agent")
@@ -28,10 +46,54 @@ def get_args():
     parser.add_argument("--display_save_path", type=str, default="plots/")
     parser.add_argument("--autoplay", action="store_true", default=False)
     parser.add_argument("--autoplay_runs", type=int, default=100)
+    parser.add_argument(
+        "--autoplay_jobs",
+        type=int,
+        default=1,
+        help="In autoplay mode, the number of worker processes used to play games in parallel",
+    )
+    parser.add_argument(
+        "--autoplay_log",
+        type=str,
+        default=None,
+        help="In autoplay mode, a CSV path that each game's result is appended to as soon as it finishes",
+    )
+    parser.add_argument(
+        "--autoplay_shard",
+        type=parse_shard,
+        default=(0, 1),
+        help="In autoplay mode, play only shard i of N (given as i/N) of the runs, to split them across machines",
+    )
     args = parser.parse_args()
     return args
 
 
+# Each autoplay worker process builds its Simulator once and reuses it for every game it plays
+_worker_simulator = None
+
+
+def _init_autoplay_worker(args):
+    """
+    Prepare a worker process for parallel autoplay.
+
+    Forked workers inherit the parent's RNG state, so reseed them to avoid every
+    worker replaying the same games.
+    """
+    global _worker_simulator
+    np.random.seed()
+    random.seed()
+    logging.disable(logging.CRITICAL)
+    _worker_simulator = Simulator(args)
+
+
+def _autoplay_worker_run(swap_players, board_fpath):
+    """
+    Play one autoplay game on this worker's Simulator.
+    Only the game setup is sent to the worker, not the whole Simulator.
+    """
+    return _worker_simulator.run(swap_players=swap_players, board_fpath=board_fpath)
+
+
 class Simulator:
     """
     Entry point of the game simulator.
@@ -93,7 +155,13 @@ class Simulator:
         while not is_end:
             is_end, p0_score, p1_score = self.world.step()
         logger.info(
-            f"Run finished. {PLAYER_1_NAME} player, agent {self.args.player_1}: {p0_score}. {PLAYER_2_NAME}, agent {self.args.player_2}: {p1_score}"
+            "Run finished. %s player, agent %s: %s. %s, agent %s: %s",
+            PLAYER_1_NAME,
+            self.args.player_1,
+            p0_score,
+            PLAYER_2_NAME,
+            self.args.player_2,
+            p1_score,
         )
         return p0_score, p1_score, self.world.p0_time, self.world.p1_time
 
@@ -101,42 +169,90 @@ class Simulator:
         """
         Run multiple simulations of the gameplay and aggregate win %
         """
-        p1_win_count = 0
-        p2_win_count = 0
-        p1_times = []
-        p2_times = []
         if self.args.display:
             logger.warning("Since running autoplay mode, display will be disabled")
         self.args.display = False
-        with all_logging_disabled():
-            for i in range(self.args.autoplay_runs):
-                swap_players = i % 2 == 0
-                board_fpath = self.board_options[ np.random.randint(len(self.board_options)) ] 
-                p0_score, p1_score, p0_time, p1_time = self.run(
-                    swap_players=swap_players, board_fpath=board_fpath
+        # Runs are assigned to shards by a hash of the run index, so every shard gets a mix of
+        # both seatings and the N shards together cover each run exactly once
+        shard_idx, shard_total = self.args.autoplay_shard
+        run_ids = [
+            i
+            for i in range(self.args.autoplay_runs)
+            if zlib.crc32(str(i).encode()) % shard_total == shard_idx
+        ]
+        if not run_ids:
+            logger.warning(f"No autoplay runs fall in shard {shard_idx}/{shard_total}")
+            return
+
+        # Draw every game's setup up front so serial and parallel runs follow the same schedule
+        schedule = [
+            (i % 2 == 0, self.board_options[np.random.randint(len(self.board_options))])
+            for i in run_ids
+        ]
+        swapped = np.array([swap_players for swap_players, _ in schedule], dtype=bool)
+
+        # Preallocated per-run results, so each game writes its own slot in whatever order it finishes
+        scores = np.full((len(schedule), 2), np.nan)
+        turn_times = [None] * len(schedule)
+
+        log_file = (
+            open(self.args.autoplay_log, "w", newline="")
+            if self.args.autoplay_log
+            else nullcontext()
+        )
+        with log_file, all_logging_disabled():
+            if self.args.autoplay_log:
+                log_writer = csv.writer(log_file)
+                log_writer.writerow(
+                    ["run", "board", "player_1_score", "player_2_score"]
                 )
-                if swap_players:
-                    p0_score, p1_score, p0_time, p1_time = (
-                        p1_score,
-                        p0_score,
-                        p1_time,
-                        p0_time,
-                    )
-                if p0_score > p1_score:
-                    p1_win_count += 1
-                elif p0_score < p1_score:
-                    p2_win_count += 1
-                else:  # Tie
-                    p1_win_count += 0.5
-                    p2_win_count += 0.5
-                p1_times.extend(p0_time)
-                p2_times.extend(p1_time)
+
+            def record(i, result):
+                p0_score, p1_score, p0_time, p1_time = result
+                scores[i] = (p0_score, p1_score)
+                turn_times[i] = (p0_time, p1_time)
+                if self.args.autoplay_log:
+                    # Flush each row so an interrupted autoplay keeps the games it finished
+                    if schedule[i][0]:
+                        p0_score, p1_score = p1_score, p0_score
+                    log_writer.writerow([run_ids[i], schedule[i][1], p0_score, p1_score])
+                    log_file.flush()
+
+            if self.args.autoplay_jobs > 1:
+                with ProcessPoolExecutor(
+                    max_workers=self.args.autoplay_jobs,
+                    initializer=_init_autoplay_worker,
+                    initargs=(self.args,),
+                ) as executor:
+                    futures = {
+                        executor.submit(_autoplay_worker_run, swap_players, board_fpath): i
+                        for i, (swap_players, board_fpath) in enumerate(schedule)
+                    }
+                    for future in as_completed(futures):
+                        record(futures[future], future.result())
+            else:
+                for i, (swap_players, board_fpath) in enumerate(schedule):
+                    record(i, self.run(swap_players=swap_players, board_fpath=board_fpath))
+
+        # Put swapped runs back in (player_1 agent, player_2 agent) order
+        scores[swapped] = scores[swapped, ::-1]
+        ties = np.sum(scores[:, 0] == scores[:, 1])
+        p1_win_count = np.sum(scores[:, 0] > scores[:, 1]) + 0.5 * ties
+        p2_win_count = np.sum(scores[:, 0] < scores[:, 1]) + 0.5 * ties
+
+        p1_times = []
+        p2_times = []
+        for swap_players, (p0_time, p1_time) in zip(swapped, turn_times):
+            if swap_players:
+                p0_time, p1_time = p1_time, p0_time
+            p1_times.extend(p0_time)
+            p2_times.extend(p1_time)
 
         logger.info(
-            f"Player 1, agent {self.args.player_1}, win percentage: {p1_win_count / self.args.autoplay_runs}. Maximum turn time was {np.round(np.max(p1_times),5)} seconds."
+            f"Player 1, agent {self.args.player_1}, win percentage: {p1_win_count / len(schedule)}. Maximum turn time was {np.round(np.max(p1_times),5)} seconds."
         )
         logger.info(
-            f"Player 2, agent {self.args.player_2}, win percentage: {p2_win_count / self.args.autoplay_runs}. Maximum turn time was {np.round(np.max(p2_times),5)} seconds."
+            f"Player 2, agent {self.args.player_2}, win percentage: {p2_win_count / len(schedule)}. Maximum turn time was {np.round(np.max(p2_times),5)} seconds."
         )
 
         """
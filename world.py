@@ -1,5 +1,4 @@
 import numpy as np
-from copy import deepcopy
 import traceback
 from agents import *
 from ui import UIEngine
@@ -9,12 +8,15 @@ import logging
 from store import AGENT_REGISTRY
 from constants import *
 import sys
-from helpers import check_move_validity, execute_move, check_endgame, random_move, get_valid_moves, MoveCoordinates
+from helpers import check_move_validity, execute_move, check_endgame, random_move, get_valid_moves, has_valid_moves, MoveCoordinates
 
 logging.basicConfig(format="%(levelname)s:%(message)s", level=logging.INFO)
 
 logger = logging.getLogger(__name__)
 
+# Parsed board layouts keyed by file path, so autoplay doesn't re-parse the same CSV every game
+BOARD_CACHE = {}
+
 
 class World:
     def __init__(
@@ -90,8 +92,10 @@ class World:
             self.board_fpath = board_fpath
             logger.info(f"Setting board path to {self.board_fpath}")
 
-        # Initialize the game board from file
-        self.chess_board = np.loadtxt(self.board_fpath, dtype=int, delimiter=',')
+        # Initialize the game board from file (cached layouts are copied since the board is mutated in place)
+        if self.board_fpath not in BOARD_CACHE:
+            BOARD_CACHE[self.board_fpath] = np.loadtxt(self.board_fpath, dtype=int, delimiter=',')
+        self.chess_board = BOARD_CACHE[self.board_fpath].copy()
         self.board_size = self.chess_board.shape[0] # We assume it is always square
 
         # Whose turn to step
@@ -162,17 +166,15 @@ class World:
         cur_player = self.get_current_player()
         opponent = self.get_current_opponent()
 
-        valid_moves = get_valid_moves(self.chess_board, cur_player)
-
-        if not valid_moves:
-            logger.info(f"Player {self.player_names[self.turn]} must pass due to having no valid moves.")
+        if not has_valid_moves(self.chess_board, cur_player):
+            logger.info("Player %s must pass due to having no valid moves.", self.player_names[self.turn])
         else:
             time_taken = None
             try:
                 # Run the agent's step function
                 start_time = time()
                 move_coords = self.get_current_agent().step( # We expect this to return MoveCoordinates
-                    deepcopy(self.chess_board),
+                    self.chess_board.copy(),
                     cur_player,
                     opponent,
                 )
@@ -198,8 +200,13 @@ class World:
 
             # Execute move
             execute_move(self.chess_board,move_coords, cur_player)
+            # Lazy %-style arguments: autoplay disables logging, so skip formatting this line every turn
             logger.info(
-                f"Player {self.player_names[self.turn]} places at SRC {move_coords.get_src()}, DEST {move_coords.get_dest()}. Time taken this turn (in seconds): {time_taken}"
+                "Player %s places at SRC %s, DEST %s. Time taken this turn (in seconds): %s",
+                self.player_names[self.turn],
+                move_coords.get_src(),
+                move_coords.get_dest(),
+                time_taken,
             )
 
         # Change turn